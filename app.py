@@ -19,9 +19,20 @@ deployment in a network‑connected environment.
 
 import os
 import json
-from typing import Any, Dict
+import base64
+import functools
+import hashlib
+import queue
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from email.mime.text import MIMEText
+from typing import Any, Dict, Optional, Tuple
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
 try:
@@ -31,6 +42,19 @@ except Exception:
     # ``dotenv`` is optional.  In production Render will provide env vars.
     pass
 
+try:
+    from cachetools import TTLCache  # type: ignore
+except ImportError:
+    # ``cachetools`` ships with ``google-auth`` (a firebase-admin dependency);
+    # without it the in-process caches below are simply disabled.
+    TTLCache = None  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    # Optional speedup; Flask's stdlib ``json`` provider is used without it.
+    orjson = None  # type: ignore
+
 # Third‑party SDKs.  These imports will fail in the current environment
 # because the necessary packages are not installed, but they are left here
 # so that the file is ready for deployment.  See ``requirements.txt``.
@@ -47,7 +71,8 @@ try:
     from plaid.model.item_public_token_exchange_request import (  # type: ignore
         ItemPublicTokenExchangeRequest,
     )
-    from firebase_admin import credentials, firestore, initialize_app  # type: ignore
+    from firebase_admin import auth, credentials, firestore, initialize_app  # type: ignore
+    from google.api_core.exceptions import AlreadyExists, InvalidArgument  # type: ignore
 except ImportError:
     # The backend cannot run without these dependencies.  They will be
     # installed in the deployment environment.  The try/except allows
@@ -60,9 +85,191 @@ except ImportError:
     Products = None  # type: ignore
     CountryCode = None  # type: ignore
     ItemPublicTokenExchangeRequest = None  # type: ignore
+    auth = None  # type: ignore
     credentials = None  # type: ignore
     firestore = None  # type: ignore
     initialize_app = None  # type: ignore
+    AlreadyExists = None  # type: ignore
+    InvalidArgument = None  # type: ignore
+
+
+# Page sizes for ``GET /transactions``.
+TRANSACTIONS_PAGE_SIZE = 50
+TRANSACTIONS_MAX_PAGE_SIZE = 500
+
+# Stripe webhook event types this backend handles.  ACH (``us_bank_account``)
+# sessions complete unpaid and are confirmed later by the async event.
+CHECKOUT_COMPLETED_EVENT = "checkout.session.completed"
+CHECKOUT_ASYNC_PAID_EVENT = "checkout.session.async_payment_succeeded"
+
+# Raw byte markers of the handled event types, for scanning unparsed payloads.
+HANDLED_STRIPE_EVENT_MARKERS = tuple(
+    b'"%s"' % event_type.encode()
+    for event_type in (CHECKOUT_COMPLETED_EVENT, CHECKOUT_ASYNC_PAID_EVENT)
+)
+
+# Maximum number of idle SMTP connections kept open for the contact form.
+SMTP_POOL_SIZE = 4
+
+# Seconds to wait on the SMTP server before giving up on a contact email.
+SMTP_TIMEOUT_SECONDS = 10
+
+# Shared worker pool for overlapping independent network calls (Firebase,
+# Firestore, Stripe, Plaid) so a request waits on the slowest call rather than
+# the sum of all of them.
+_executor = ThreadPoolExecutor(max_workers=16)
+
+# Separate small pool for fire-and-forget side effects (contact form storage
+# and email) so slow or hung sends can never delay the latency-critical reads
+# submitted to ``_executor``.
+_background_executor = ThreadPoolExecutor(max_workers=4)
+
+# Verified Firebase ID tokens, keyed by a digest of the token, mapping to
+# ``(uid, exp)``.  Entries are never served past the token's own expiry.
+_token_cache = TTLCache(maxsize=10_000, ttl=300) if TTLCache else None
+_token_cache_lock = threading.Lock()
+
+# Firestore ``users/{uid}.email`` lookups used to prefill Stripe Checkout.
+_email_cache = TTLCache(maxsize=50_000, ttl=3600) if TTLCache else None
+_email_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Environment configuration, read once per process by ``get_settings``.
+
+    Secrets are excluded from ``repr`` so they never show up in logs or the
+    debugger.
+    """
+
+    stripe_secret_key: Optional[str] = field(repr=False)
+    stripe_publishable_key: Optional[str]
+    stripe_webhook_secret: Optional[str] = field(repr=False)
+    plaid_env: str
+    plaid_client_id: Optional[str]
+    plaid_secret: Optional[str] = field(repr=False)
+    contact_email: Optional[str]
+    smtp_host: Optional[str]
+    smtp_port: Optional[int]
+    smtp_user: Optional[str]
+    smtp_password: Optional[str] = field(repr=False)
+
+    @property
+    def smtp_configured(self) -> bool:
+        return all(
+            [
+                self.contact_email,
+                self.smtp_host,
+                self.smtp_port,
+                self.smtp_user,
+                self.smtp_password,
+            ]
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Read and validate the environment variables used by the app."""
+    plaid_env = os.getenv("PLAID_ENV", "sandbox").lower()
+    if plaid_env not in {"sandbox", "development", "production"}:
+        raise ValueError("PLAID_ENV must be one of sandbox, development, production")
+    raw_smtp_port = os.getenv("SMTP_PORT")
+    smtp_port: Optional[int] = None
+    if raw_smtp_port:
+        try:
+            smtp_port = int(raw_smtp_port)
+        except ValueError:
+            # Email is optional; a bad port only disables contact emails.
+            print(f"Invalid SMTP_PORT {raw_smtp_port!r}; contact emails disabled.")
+    return Settings(
+        stripe_secret_key=os.getenv("STRIPE_SECRET_KEY"),
+        stripe_publishable_key=os.getenv("STRIPE_PUBLISHABLE_KEY"),
+        stripe_webhook_secret=os.getenv("STRIPE_WEBHOOK_SECRET"),
+        plaid_env=plaid_env,
+        plaid_client_id=os.getenv("PLAID_CLIENT_ID"),
+        plaid_secret=os.getenv("PLAID_SECRET"),
+        contact_email=os.getenv("CONTACT_EMAIL"),
+        smtp_host=os.getenv("SMTP_HOST"),
+        smtp_port=smtp_port,
+        smtp_user=os.getenv("SMTP_USER"),
+        smtp_password=os.getenv("SMTP_PASSWORD"),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _firebase_credential() -> Any:
+    """Load the Firebase service account credential once per process.
+
+    Firestore requires a service account.  The JSON string can be supplied
+    either via a path or as an environment variable.  Render supports
+    multi‑line environment variables which we read here.
+    """
+    firebase_credentials_json = os.getenv("FIREBASE_SERVICE_ACCOUNT_JSON")
+    if firebase_credentials_json:
+        loads = orjson.loads if orjson is not None else json.loads
+        return credentials.Certificate(loads(firebase_credentials_json))
+    # Attempt to load from a file specified by FIREBASE_SERVICE_ACCOUNT_FILE
+    firebase_key_path = os.getenv("FIREBASE_SERVICE_ACCOUNT_FILE")
+    if firebase_key_path and os.path.exists(firebase_key_path):
+        return credentials.Certificate(firebase_key_path)
+    raise RuntimeError("Firebase service account credentials not provided.")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by ``orjson``.
+
+    Output matches Flask's default provider (sorted keys, HTTP-date datetimes)
+    but encoding and decoding run in native code.
+    """
+
+    options = 0 if orjson is None else (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=self.options).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Any:
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(
+            obj,
+            default=self.default,
+            option=self.options | orjson.OPT_APPEND_NEWLINE,
+        )
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def _log_failures(action: str, func: Any, *args: Any) -> None:
+    """Call ``func`` with ``args``, logging any exception instead of raising.
+
+    Used as the target of fire-and-forget ``_background_executor`` tasks, whose
+    exceptions would otherwise be silently kept on an unobserved future.
+    """
+    try:
+        func(*args)
+    except Exception as exc:  # pylint: disable=broad-except
+        print(f"Failed to {action}: {exc}")
+
+
+def _unverified_uid(id_token: str) -> Optional[str]:
+    """Read the ``sub`` claim of a Firebase ID token *without* verifying it.
+
+    Only used to start speculative Firestore reads early; the result must never
+    be trusted until ``auth.verify_id_token`` has confirmed the same uid.
+    """
+    try:
+        payload = id_token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        uid = claims.get("sub")
+        return uid if isinstance(uid, str) and uid else None
+    except Exception:
+        return None
 
 
 def create_app() -> Flask:
@@ -72,68 +279,146 @@ def create_app() -> Flask:
     effects (useful for testing).
     """
     app = Flask(__name__)
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
     CORS(app)
+    settings = get_settings()
 
     # ----- Stripe configuration -----
-    stripe_secret_key = os.getenv("STRIPE_SECRET_KEY")
-    stripe_publishable_key = os.getenv("STRIPE_PUBLISHABLE_KEY")
-    if stripe and stripe_secret_key:
-        stripe.api_key = stripe_secret_key
+    if stripe and settings.stripe_secret_key:
+        stripe.api_key = settings.stripe_secret_key
 
     # ----- Plaid configuration -----
     plaid_client: Any = None
     if plaid:
-        plaid_env = os.getenv("PLAID_ENV", "sandbox").lower()
-        if plaid_env not in {"sandbox", "development", "production"}:
-            raise ValueError("PLAID_ENV must be one of sandbox, development, production")
         host = {
             "sandbox": plaid.Environment.Sandbox,
             "development": plaid.Environment.Development,
             "production": plaid.Environment.Production,
-        }[plaid_env]
+        }[settings.plaid_env]
         config = plaid.Configuration(
             host=host,
             api_key={
-                "clientId": os.getenv("PLAID_CLIENT_ID"),
-                "secret": os.getenv("PLAID_SECRET"),
+                "clientId": settings.plaid_client_id,
+                "secret": settings.plaid_secret,
             },
         )
         plaid_client = plaid_api.PlaidApi(plaid.ApiClient(config))
+        # Link token options are identical for every user; build the
+        # validated model objects once instead of on every request.
+        plaid_products = [Products("auth")]
+        plaid_country_codes = [CountryCode("US")]
 
     # ----- Firebase configuration -----
     db = None
     if credentials:
-        # Firestore requires a service account.  The JSON string can be
-        # supplied either via a path or as an environment variable.  Render
-        # supports multi‑line environment variables which we read here.
-        firebase_credentials_json = os.getenv("FIREBASE_SERVICE_ACCOUNT_JSON")
-        if firebase_credentials_json:
-            creds_dict = json.loads(firebase_credentials_json)
-            cred = credentials.Certificate(creds_dict)
-        else:
-            # Attempt to load from a file specified by FIREBASE_SERVICE_ACCOUNT_FILE
-            firebase_key_path = os.getenv("FIREBASE_SERVICE_ACCOUNT_FILE")
-            if firebase_key_path and os.path.exists(firebase_key_path):
-                cred = credentials.Certificate(firebase_key_path)
-            else:
-                raise RuntimeError(
-                    "Firebase service account credentials not provided."
-                )
-        initialize_app(cred)
+        initialize_app(_firebase_credential())
         db = firestore.client()
 
     # Helper to verify Firebase ID tokens on protected routes.  Client code
     # should include the ID token in the Authorization header as
     # ``Bearer <id_token>``.
-    def _verify_firebase_id_token() -> str:
-        from firebase_admin import auth  # type: ignore
+    def _bearer_token() -> str:
         auth_header = request.headers.get("Authorization")
         if not auth_header or not auth_header.startswith("Bearer "):
             raise ValueError("Missing Authorization header")
-        id_token = auth_header.split(" ")[1]
+        return auth_header.split(" ")[1]
+
+    def _token_cache_key(id_token: str) -> bytes:
+        return hashlib.blake2b(id_token.encode(), digest_size=16).digest()
+
+    def _cached_token_uid(id_token: str) -> Optional[str]:
+        """Return the uid of an already verified, unexpired token, if cached."""
+        if _token_cache is None:
+            return None
+        with _token_cache_lock:
+            cached = _token_cache.get(_token_cache_key(id_token))
+        if cached and cached[1] > time.time():
+            return cached[0]
+        return None
+
+    def _verify_firebase_id_token(id_token: Optional[str] = None) -> str:
+        if id_token is None:
+            id_token = _bearer_token()
+        if _token_cache is None:
+            return auth.verify_id_token(id_token)["uid"]
+        cached_uid = _cached_token_uid(id_token)
+        if cached_uid:
+            return cached_uid
+        key = _token_cache_key(id_token)
         decoded = auth.verify_id_token(id_token)
+        with _token_cache_lock:
+            _token_cache[key] = (decoded["uid"], decoded.get("exp", 0))
         return decoded["uid"]
 
+    def _fetch_user_email(uid: str) -> Optional[str]:
+        # Only the email field is needed; a field mask keeps the payload small.
+        snap = db.collection("users").document(uid).get(field_paths=["email"])
+        email = None
+        if snap.exists:
+            # Read the field straight from the snapshot instead of building a
+            # dict of the whole document.  ``get`` raises if it is missing.
+            try:
+                email = snap.get("email")
+            except KeyError:
+                pass
+        return email
+
+    def _store_user_email(uid: str, email: Optional[str]) -> None:
+        """Cache an email lookup; only call once ``uid`` has been verified."""
+        if _email_cache is not None:
+            with _email_cache_lock:
+                _email_cache[uid] = email
+
+    def _cached_user_email(uid: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """Return ``(hit, email)`` from the in-process email cache."""
+        if _email_cache is None or not uid:
+            return False, None
+        with _email_cache_lock:
+            if uid in _email_cache:
+                return True, _email_cache[uid]
+        return False, None
+
+    # Idle, already authenticated SMTP connections reused across contact form
+    # submissions so each email does not pay for a new TLS handshake and login.
+    smtp_pool: "queue.Queue[smtplib.SMTP]" = queue.Queue(maxsize=SMTP_POOL_SIZE)
+
+    def _smtp_connect() -> smtplib.SMTP:
+        server = smtplib.SMTP(
+            settings.smtp_host, settings.smtp_port, timeout=SMTP_TIMEOUT_SECONDS
+        )
+        try:
+            server.starttls()
+            server.login(settings.smtp_user, settings.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _send_email(msg: Any) -> None:
+        server = None
+        try:
+            server = smtp_pool.get_nowait()
+            # The server may have dropped an idle connection; probe it first.
+            if server.noop()[0] != 250:
+                raise smtplib.SMTPServerDisconnected("SMTP connection went stale")
+        except queue.Empty:
+            pass
+        except (smtplib.SMTPException, OSError):
+            server.close()
+            server = None
+        if server is None:
+            server = _smtp_connect()
+        try:
+            server.send_message(msg)
+        except Exception:
+            server.close()
+            raise
+        try:
+            smtp_pool.put_nowait(server)
+        except queue.Full:
+            server.quit()
+
     # ----- Routes -----
 
     @app.route("/health", methods=["GET"])
@@ -150,8 +435,9 @@ def create_app() -> Flask:
           ``description``: string description shown in Stripe checkout (optional)
           ``success_url``: URL to redirect on successful payment
           ``cancel_url``: URL to redirect if the user cancels
-        The user's email address will be pulled from the Firebase ID token
-        included in the Authorization header.
+          ``customer_email``: email to prefill in Stripe checkout (optional)
+        When ``customer_email`` is omitted the user's email address will be
+        pulled from the Firebase ID token included in the Authorization header.
         """
         if stripe is None:
             return jsonify({"error": "Stripe SDK not installed"}), 500
@@ -163,14 +449,39 @@ def create_app() -> Flask:
         if not all([amount, success_url, cancel_url]):
             return jsonify({"error": "amount, success_url and cancel_url are required"}), 400
         try:
-            uid = _verify_firebase_id_token()
-            # Retrieve user email from Firestore (optional).  Clients could also
-            # send ``customer_email`` directly.
-            customer_email = None
-            if db:
-                doc = db.collection("users").document(uid).get()
-                if doc.exists:
-                    customer_email = doc.to_dict().get("email")
+            id_token = _bearer_token()
+            # Retrieve user email from Firestore (optional) unless the client
+            # sent ``customer_email`` directly or it is already cached.  The
+            # read is started speculatively from the token's unverified uid so
+            # that it overlaps with signature verification; it is only used if
+            # the verified uid matches.  Tokens already in the verification
+            # cache need no overlap, so no speculative read is made for them.
+            customer_email = data.get("customer_email")
+            guessed_uid = None
+            email_future = None
+            if db and not customer_email and _cached_token_uid(id_token) is None:
+                guessed_uid = _unverified_uid(id_token)
+                if guessed_uid and not _cached_user_email(guessed_uid)[0]:
+                    email_future = _executor.submit(_fetch_user_email, guessed_uid)
+            try:
+                uid = _verify_firebase_id_token(id_token)
+            except Exception:
+                if email_future is not None:
+                    email_future.cancel()
+                raise
+            if email_future is not None and guessed_uid != uid:
+                email_future.cancel()
+                email_future = None
+            if db and not customer_email:
+                cache_hit, customer_email = _cached_user_email(uid)
+                if not cache_hit:
+                    # A read still queued behind other work is cancelled and
+                    # done inline, so checkout never waits on a busy pool.
+                    if email_future is not None and not email_future.cancel():
+                        customer_email = email_future.result()
+                    else:
+                        customer_email = _fetch_user_email(uid)
+                    _store_user_email(uid, customer_email)
             session = stripe.checkout.Session.create(
                 payment_method_types=["card", "us_bank_account"],
                 line_items=[
@@ -184,6 +495,7 @@ def create_app() -> Flask:
                     }
                 ],
                 mode="payment",
+                client_reference_id=uid,
                 customer_email=customer_email,
                 success_url=success_url,
                 cancel_url=cancel_url,
@@ -196,44 +508,98 @@ def create_app() -> Flask:
     def stripe_webhook():
         """Handle Stripe webhook events.
 
-        This endpoint records successful payments in Firestore.  Configure the
+        This endpoint records completed checkouts in Firestore and marks ACH
+        payments as paid once Stripe confirms them.  Configure the
         webhook endpoint in your Stripe dashboard to point to
         ``<backend-url>/stripe/webhook``.  When testing locally you can use
-        Stripe CLI to forward events to your local server.
+        Stripe CLI to forward events to your local server.  Events are only
+        accepted when ``STRIPE_WEBHOOK_SECRET`` is set and the signature matches.
         """
         if stripe is None or db is None:
             return "", 500
         payload = request.data
         sig_header = request.headers.get("Stripe-Signature")
-        webhook_secret = os.getenv("STRIPE_WEBHOOK_SECRET")
-        event = None
+        webhook_secret = settings.stripe_webhook_secret
+        if not webhook_secret:
+            # Never accept unsigned events; anyone could forge a payment.
+            return "", 500
+        # Only checkout events are recorded.  Stripe puts the event type
+        # after the (large) ``data`` object, so scan the whole payload for the
+        # type strings and acknowledge everything else without verifying or
+        # parsing it; nothing is written for those events either way.
+        if not any(marker in payload for marker in HANDLED_STRIPE_EVENT_MARKERS):
+            return "", 200
         try:
-            if webhook_secret:
-                event = stripe.Webhook.construct_event(
-                    payload, sig_header, webhook_secret
-                )
-            else:
-                event = stripe.Event.construct_from(
-                    json.loads(payload), stripe.api_key
-                )
+            # Verify the signature (rejecting stale timestamps to prevent
+            # replays, as ``construct_event`` does), then parse the payload
+            # exactly once with the app's JSON provider instead of stripe's
+            # stdlib parse.
+            stripe.WebhookSignature.verify_header(
+                payload.decode("utf-8"),
+                sig_header,
+                webhook_secret,
+                tolerance=stripe.Webhook.DEFAULT_TOLERANCE,
+            )
+            event = stripe.Event.construct_from(
+                app.json.loads(payload), stripe.api_key
+            )
         except Exception:
             return "", 400
         # Handle the event
-        if event["type"] == "checkout.session.completed":
-            session = event["data"]["object"]
-            uid = session.get("client_reference_id")
-            if not uid:
-                uid = "unknown"
-            # Save transaction in Firestore
-            db.collection("users").document(uid).collection("transactions").add(
-                {
-                    "amount": session["amount_total"],
-                    "currency": session["currency"],
-                    "payment_intent": session.get("payment_intent"),
-                    "status": session["payment_status"],
-                    "timestamp": firestore.SERVER_TIMESTAMP,
-                }
-            )
+        if event["type"] not in {CHECKOUT_COMPLETED_EVENT, CHECKOUT_ASYNC_PAID_EVENT}:
+            return "", 200
+        session = event["data"]["object"]
+        uid = session.get("client_reference_id")
+        if not uid:
+            uid = "unknown"
+        user_ref = db.collection("users").document(uid)
+        # Transactions are keyed on the session id so that redelivered or
+        # out-of-order events never count the same payment twice.
+        tx_ref = user_ref.collection("transactions").document(session["id"])
+        transaction_fields = {
+            "amount": session["amount_total"],
+            "currency": session["currency"],
+            "payment_intent": session.get("payment_intent"),
+            "status": session["payment_status"],
+            "timestamp": firestore.SERVER_TIMESTAMP,
+        }
+        # Only money actually collected counts towards the user's totals, and
+        # totals are never kept on the shared ``unknown`` fallback document.
+        totals = None
+        if uid != "unknown":
+            totals = {
+                "last_payment_ts": firestore.SERVER_TIMESTAMP,
+                "lifetime_cents": firestore.Increment(session["amount_total"]),
+            }
+        if event["type"] == CHECKOUT_COMPLETED_EVENT:
+            # Save the transaction and update the user's payment totals in a
+            # single atomic batch (one round-trip to Firestore).  The document
+            # is created, not set, so a redelivered event (or one arriving
+            # after its async payment event) fails the whole batch.
+            batch = db.batch()
+            batch.create(tx_ref, transaction_fields)
+            if totals and session["payment_status"] == "paid":
+                batch.set(user_ref, totals, merge=True)
+            try:
+                batch.commit()
+            except AlreadyExists:
+                # Already recorded by an earlier delivery of this event.
+                pass
+        else:
+
+            @firestore.transactional
+            def _record_async_payment(transaction: Any) -> None:
+                snap = tx_ref.get(transaction=transaction)
+                if snap.exists and (snap.to_dict() or {}).get("status") == "paid":
+                    return
+                if snap.exists:
+                    transaction.update(tx_ref, {"status": "paid"})
+                else:
+                    transaction.create(tx_ref, {**transaction_fields, "status": "paid"})
+                if totals:
+                    transaction.set(user_ref, totals, merge=True)
+
+            _record_async_payment(db.transaction())
         # Return 200 to acknowledge receipt of the event
         return "", 200
 
@@ -250,8 +616,8 @@ def create_app() -> Flask:
         request_body = LinkTokenCreateRequest(
             user=LinkTokenCreateRequestUser(client_user_id=uid),
             client_name="Zarcaro APC",
-            products=[Products("auth")],
-            country_codes=[CountryCode("US")],
+            products=plaid_products,
+            country_codes=plaid_country_codes,
             language="en",
         )
         try:
@@ -294,7 +660,8 @@ def create_app() -> Flask:
         Expects JSON payload with ``name``, ``email`` and ``message`` fields.
         Attempts to send an email via SMTP if CONTACT_EMAIL and SMTP_* env vars
         are configured.  Regardless of whether email sending succeeds, the
-        message is stored in Firestore for later retrieval.
+        message is stored in Firestore for later retrieval.  Both side effects
+        run in the background so the response does not wait on them.
         """
         data = request.get_json() or {}
         name = data.get("name")
@@ -304,34 +671,28 @@ def create_app() -> Flask:
             return jsonify({"error": "name, email and message are required"}), 400
         # Save message to Firestore
         if db:
-            db.collection("contact_messages").add(
+            _background_executor.submit(
+                _log_failures,
+                "store contact message",
+                db.collection("contact_messages").add,
                 {
                     "name": name,
                     "email": email,
                     "message": message,
                     "timestamp": firestore.SERVER_TIMESTAMP,
-                }
+                },
             )
         # Attempt to send email
-        contact_email = os.getenv("CONTACT_EMAIL")
-        smtp_host = os.getenv("SMTP_HOST")
-        smtp_port = os.getenv("SMTP_PORT")
-        smtp_user = os.getenv("SMTP_USER")
-        smtp_password = os.getenv("SMTP_PASSWORD")
-        if contact_email and smtp_host and smtp_port and smtp_user and smtp_password:
+        if settings.smtp_configured:
             try:
-                import smtplib
-                from email.mime.text import MIMEText
-
                 body = f"Message from {name} <{email}>:\n\n{message}"
                 msg = MIMEText(body)
                 msg["Subject"] = "New contact form submission"
-                msg["From"] = smtp_user
-                msg["To"] = contact_email
-                with smtplib.SMTP(smtp_host, int(smtp_port)) as server:
-                    server.starttls()
-                    server.login(smtp_user, smtp_password)
-                    server.send_message(msg)
+                msg["From"] = settings.smtp_user
+                msg["To"] = settings.contact_email
+                _background_executor.submit(
+                    _log_failures, "send contact email", _send_email, msg
+                )
             except Exception as exc:
                 # Log but do not fail the request
                 print(f"Failed to send contact email: {exc}")
@@ -339,26 +700,66 @@ def create_app() -> Flask:
 
     @app.route("/transactions", methods=["GET"])
     def list_transactions():
-        """Return a list of past transactions for the authenticated user."""
+        """Return a page of past transactions for the authenticated user.
+
+        Accepts optional query parameters:
+          ``limit``: maximum number of transactions to return (default 50,
+          at most 500)
+          ``start_after``: ``id`` of the last transaction of the previous page
+        Transactions are returned newest first as a JSON array that is streamed
+        as documents arrive from Firestore.  When a full page is returned, pass
+        the ``id`` of its last transaction as ``start_after`` to fetch the next.
+        """
         if db is None:
             return jsonify({"error": "Firestore not configured"}), 500
         try:
             uid = _verify_firebase_id_token()
         except Exception as exc:
             return jsonify({"error": str(exc)}), 401
-        docs = (
-            db.collection("users")
-            .document(uid)
-            .collection("transactions")
-            .order_by("timestamp", direction=firestore.Query.DESCENDING)
-            .stream()
+        try:
+            limit = int(request.args.get("limit", TRANSACTIONS_PAGE_SIZE))
+        except ValueError:
+            return jsonify({"error": "limit must be an integer"}), 400
+        limit = max(1, min(limit, TRANSACTIONS_MAX_PAGE_SIZE))
+        transactions = db.collection("users").document(uid).collection("transactions")
+        query = transactions.order_by(
+            "timestamp", direction=firestore.Query.DESCENDING
+        ).limit(limit)
+        start_after = request.args.get("start_after")
+        if start_after:
+            try:
+                cursor = transactions.document(start_after).get()
+            except (ValueError, InvalidArgument):
+                # Ids containing ``/`` or reserved names are not valid cursors.
+                cursor = None
+            if cursor is None or not cursor.exists:
+                return jsonify({"error": "Invalid start_after cursor"}), 400
+            query = query.start_after(cursor)
+
+        # Pull the first document before responding so that query failures
+        # still surface as an error status rather than a truncated 200 body.
+        docs = query.stream()
+        first = next(docs, None)
+        if first is None:
+            return jsonify([])
+
+        def encode(doc: Any) -> bytes:
+            item = {**doc.to_dict(), "id": doc.id}
+            if orjson is not None:
+                return orjson.dumps(
+                    item, default=app.json.default, option=OrjsonProvider.options
+                )
+            return app.json.dumps(item).encode()
+
+        def generate():
+            yield b"[" + encode(first)
+            for doc in docs:
+                yield b"," + encode(doc)
+            yield b"]\n"
+
+        return app.response_class(
+            stream_with_context(generate()), mimetype="application/json"
         )
-        results = []
-        for doc in docs:
-            data = doc.to_dict()
-            data["id"] = doc.id
-            results.append(data)
-        return jsonify(results)
 
     return app
 